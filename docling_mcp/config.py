@@ -0,0 +1,23 @@
+"""This module evaluates environment configuration once at import time.
+
+Importing the flags from here avoids re-parsing the environment at every
+module that gates optional features.
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+OLLAMA_MODEL: str | None = os.getenv("OLLAMA_MODEL")
+EMBEDDING_MODEL: str | None = os.getenv("EMBEDDING_MODEL")
+OLLAMA_EXTRACTION_MODEL: str | None = os.getenv("OLLAMA_EXTRACTION_MODEL")
+
+RAG_ENABLED: bool = (
+    os.getenv("RAG_ENABLED") == "true"
+    and OLLAMA_MODEL is not None
+    and EMBEDDING_MODEL is not None
+)
+
+EXTRACTION_ENABLED: bool = OLLAMA_EXTRACTION_MODEL is not None
@@ -2,10 +2,15 @@
 
 import hashlib
 import json
+import mmap
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any
+
+from pydantic import ValidationError
+
+from docling_core.types.doc.document import DoclingDocument
 
 from docling_mcp.logger import setup_logger
 
@@ -69,13 +74,70 @@ def get_cache_dir() -> Path:
 
 
 def get_cache_key(
-    source: str, enable_ocr: bool = False, ocr_language: Optional[list[str]] = None
+    source: str, enable_ocr: bool = False, ocr_language: list[str] | None = None
 ) -> str:
-    """Generate a cache key for the document conversion."""
-    key_data = {
+    """Generate a cache key for the document conversion.
+
+    URLs are keyed on the URL itself (already unique). Local files
+    additionally fold the file size and modification time into the key, so a
+    changed file gets a fresh key without ever reading the file content.
+    """
+    key_data: dict[str, Any] = {
         "source": source,
         "enable_ocr": enable_ocr,
         "ocr_language": ocr_language or [],
     }
+
+    if not source.startswith(("http://", "https://")):
+        try:
+            stat = os.stat(source)
+        except OSError:
+            # Not an existing local file; key on the source string alone
+            pass
+        else:
+            key_data["st_size"] = stat.st_size
+            key_data["st_mtime_ns"] = stat.st_mtime_ns
+
     key_str = json.dumps(key_data, sort_keys=True)
     return hashlib.md5(key_str.encode()).hexdigest()
+
+
+def save_document_to_cache_dir(cache_key: str, document: DoclingDocument) -> Path:
+    """Persist a document as a JSON blob in the cache directory.
+
+    Spilled documents can be reloaded after an in-memory cache eviction (or a
+    server restart) instead of being converted again.
+    """
+    path = get_cache_dir() / f"{cache_key}.json"
+    path.write_text(document.model_dump_json(), encoding="utf-8")
+
+    return path
+
+
+def spilled_document_exists(cache_key: str) -> bool:
+    """Check whether a spilled document exists for the key, without loading it.
+
+    A bare existence probe, so membership checks on evicted documents cost a
+    stat call instead of reading and validating the whole JSON blob.
+    """
+    return (get_cache_dir() / f"{cache_key}.json").exists()
+
+
+def load_document_from_cache_dir(cache_key: str) -> DoclingDocument | None:
+    """Reload a previously persisted document from the cache directory.
+
+    The JSON blob is read through mmap, so the OS page cache keeps hot
+    documents in RAM and evicts cold ones for free. Returns None when no
+    (valid) spilled document exists for the key.
+    """
+    path = get_cache_dir() / f"{cache_key}.json"
+    try:
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return DoclingDocument.model_validate_json(bytes(mapped))
+    except ValidationError:
+        logger.warning(f"Invalid spilled document for cache-key: {cache_key}")
+        return None
+    except (OSError, ValueError):
+        # Missing file, or an empty one that cannot be mapped
+        return None
@@ -1,10 +1,17 @@
 """Utility module for logging."""
 
+import functools
 import logging
 
 
+@functools.cache
 def setup_logger() -> logging.Logger:
-    """Setup and return a logger for the entire project."""
+    """Setup and return a logger for the entire project.
+
+    The setup runs once; later calls return the cached logger, so importing
+    several tool modules does not stack duplicate handlers on the shared
+    "docling_mcp" logger (which would emit every record multiple times).
+    """
     # Create logger
     logger = logging.getLogger("docling_mcp")
     logger.setLevel(logging.INFO)
@@ -1,10 +1,9 @@
 """This module initializes and runs the Docling MCP server."""
 
+import argparse
 import enum
-import os
-
-import typer
 
+from docling_mcp.config import RAG_ENABLED
 from docling_mcp.logger import setup_logger
 from docling_mcp.shared import mcp
 from docling_mcp.tools.conversion import (
@@ -14,7 +13,9 @@ from docling_mcp.tools.conversion import (
 from docling_mcp.tools.generation import (
     add_list_items_to_list_in_docling_document,
     add_paragraph_to_docling_document,
+    add_paragraphs_to_docling_document,
     add_section_heading_to_docling_document,
+    add_section_headings_to_docling_document,
     add_title_to_docling_document,
     close_list_in_docling_document,
     create_new_docling_document,
@@ -23,18 +24,12 @@ from docling_mcp.tools.generation import (
     save_docling_document,
 )
 
-if (
-    os.getenv("RAG_ENABLED") == "true"
-    and os.getenv("OLLAMA_MODEL") != ""
-    and os.getenv("EMBEDDING_MODEL") != ""
-):
+if RAG_ENABLED:
     from docling_mcp.tools.applications import (
-        export_docling_document_to_vector_db,
+        export_docling_documents_to_vector_db,
         search_documents,
     )
 
-app = typer.Typer()
-
 
 class TransportType(str, enum.Enum):
     """List of available protocols."""
@@ -44,19 +39,24 @@ class TransportType(str, enum.Enum):
     STREAMABLE_HTTP = "streamable-http"
 
 
-@app.command()
-def main(
-    transport: TransportType = TransportType.STDIO,
-    http_port: int = 8000,
-) -> None:
+def main() -> None:
     """Initialize and run the Docling MCP server."""
+    parser = argparse.ArgumentParser(description="Run the Docling MCP server.")
+    parser.add_argument(
+        "--transport",
+        choices=[transport.value for transport in TransportType],
+        default=TransportType.STDIO.value,
+    )
+    parser.add_argument("--http-port", type=int, default=8000)
+    args = parser.parse_args()
+
     # Create a default project logger
     logger = setup_logger()
     logger.info("starting up Docling MCP-server ...")
 
     # Initialize and run the server
-    mcp.settings.port = http_port
-    mcp.run(transport=transport.value)
+    mcp.settings.port = args.http_port
+    mcp.run(transport=args.transport)
 
 
 if __name__ == "__main__":
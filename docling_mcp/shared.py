@@ -1,8 +1,11 @@
 """This module defines shared resources."""
 
+import json
 import os
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
 
-from dotenv import load_dotenv
 from llama_index.core import Settings
 from llama_index.core.indices.vector_store.base import VectorStoreIndex
 from llama_index.embeddings.huggingface import HuggingFaceEmbedding
@@ -16,41 +19,247 @@ from docling_core.types.doc.document import (
     NodeItem,
 )
 
-load_dotenv()
+from docling_mcp.config import (
+    EMBEDDING_MODEL,
+    EXTRACTION_ENABLED,
+    OLLAMA_EXTRACTION_MODEL,
+    OLLAMA_MODEL,
+    RAG_ENABLED,
+)
+from docling_mcp.docling_cache import (
+    load_document_from_cache_dir,
+    save_document_to_cache_dir,
+    spilled_document_exists,
+)
+from docling_mcp.logger import setup_logger
+
+# Create a default project logger
+logger = setup_logger()
 
 
 # Create a single shared FastMCP instance
 mcp = FastMCP("docling")
 
-# Define your shared cache here if it's used by multiple tools
-local_document_cache: dict[str, DoclingDocument] = {}
+
+class LRUCache(OrderedDict[str, Any]):
+    """A dict with LRU eviction to keep long-running servers from growing unbounded.
+
+    Lookups refresh an entry's recency. Inserting beyond maxsize evicts the
+    least recently used entry and passes it to the optional on_evict callback
+    so the entry can be persisted and sibling caches can drop the same key in
+    lockstep. An optional loader is consulted on lookup misses, so evicted
+    entries can be reloaded transparently (e.g. from a disk spill); the
+    optional probe answers membership checks for loadable entries without
+    triggering that load.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        on_evict: Callable[[str, Any], None] | None = None,
+        loader: Callable[[str], Any] | None = None,
+        probe: Callable[[str], bool] | None = None,
+    ) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self.loader = loader
+        self.probe = probe
+
+    def __missing__(self, key: str) -> Any:
+        """Consult the loader on a miss, caching and returning a loaded value."""
+        if self.loader is not None:
+            value = self.loader(key)
+            if value is not None:
+                self[key] = value
+                return value
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Report membership, counting entries the probe can see on disk.
+
+        Deliberately read-only: loading (and inserting) a spilled entry here
+        would evict a resident one, turning every membership check into a
+        cache mutation plus a full parse of the spilled blob.
+        """
+        if super().__contains__(key):
+            return True
+        return self.probe is not None and isinstance(key, str) and self.probe(key)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value for key, refreshing its recency."""
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for key (refreshing its recency) or default."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Insert or update an entry, evicting the LRU entries past maxsize."""
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            evicted_key, evicted_value = self.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(evicted_key, evicted_value)
+
+
+# Maximum number of documents kept in the local cache before LRU eviction
+MAX_CACHED_DOCUMENTS: int = int(os.getenv("DOCLING_MCP_MAX_DOCS", "256"))
+
+# Callbacks run with the key of every document dropped from the in-memory
+# cache, so per-document caches living in other modules (e.g. the
+# manipulation tools' anchor indexes) release their entries in lockstep
+# instead of keeping the evicted object alive
+_eviction_listeners: list[Callable[[str], None]] = []
+
+
+def register_eviction_listener(listener: Callable[[str], None]) -> None:
+    """Register a callback invoked with the key of each evicted document."""
+    _eviction_listeners.append(listener)
+
+
+def _reload_spilled_document(cache_key: str) -> Any:
+    """Reload an evicted document from its disk spill on a cache miss.
+
+    Also rebuilds a best-effort stack entry (the last item in the document
+    body) so the generation tools can keep appending to the reloaded document.
+    """
+    document = load_document_from_cache_dir(cache_key)
+
+    if document is not None and cache_key not in local_stack_cache:
+        try:
+            item = document.body.children[-1].resolve(doc=document)
+            local_stack_cache[cache_key] = [item]
+        except (AttributeError, IndexError):
+            local_stack_cache[cache_key] = []
+
+    return document
+
+
+def _spill_evicted_document(cache_key: str, document: DoclingDocument) -> None:
+    """Persist an evicted document to disk before dropping it from memory.
+
+    PDF conversions are spilled at conversion time, but documents built with
+    the generation tools exist only in memory; writing the evicted document
+    here means eviction never loses data and the loader can always bring the
+    document back. The write also refreshes any stale earlier spill.
+    """
+    try:
+        save_document_to_cache_dir(cache_key, document)
+    except OSError:
+        logger.exception(f"Failed to spill evicted document: {cache_key}")
+
+    local_stack_cache.pop(cache_key, None)
+    for listener in _eviction_listeners:
+        listener(cache_key)
+
+
+# Define your shared cache here if it's used by multiple tools.
+# local_document_cache maps document keys to DoclingDocument objects.
 local_stack_cache: dict[str, list[NodeItem]] = {}
+local_document_cache: LRUCache = LRUCache(
+    maxsize=MAX_CACHED_DOCUMENTS,
+    on_evict=_spill_evicted_document,
+    loader=_reload_spilled_document,
+    probe=spilled_document_exists,
+)
+
+
+class _CacheMissMessage:
+    """Error message whose key listing is joined only when formatted.
+
+    Joining hundreds of cached keys is wasted work when the caller catches
+    the ValueError without ever rendering it; deferring to __str__ makes the
+    raise itself allocation-free.
+    """
+
+    __slots__ = ("document_key",)
 
-OLLAMA_MODEL: str | None = os.getenv("OLLAMA_MODEL")
-EMBEDDING_MODEL: str | None = os.getenv("EMBEDDING_MODEL")
-OLLAMA_EXTRACTION_MODEL: str | None = os.getenv("OLLAMA_EXTRACTION_MODEL")
+    def __init__(self, document_key: str) -> None:
+        self.document_key = document_key
 
+    def __str__(self) -> str:
+        doc_keys = ", ".join(local_document_cache)
+        return (
+            f"document-key: {self.document_key} is not found. "
+            f"Existing document-keys are: {doc_keys}"
+        )
 
-if (
-    os.getenv("RAG_ENABLED") == "true"
-    and OLLAMA_MODEL is not None
-    and EMBEDDING_MODEL is not None
-):
-    embed_model = HuggingFaceEmbedding(model_name=EMBEDDING_MODEL)
+
+def get_cached_document(document_key: str) -> DoclingDocument:
+    """Return the cached document for the key with a single dict probe.
+
+    The error message joining the existing keys is only built when the
+    exception is actually formatted, so neither the success path nor a
+    caught-and-discarded miss does that work.
+
+    Raises:
+        ValueError: If the specified document_key does not exist in the local cache.
+    """
+    try:
+        document: DoclingDocument = local_document_cache[document_key]
+    except KeyError:
+        raise ValueError(_CacheMissMessage(document_key)) from None
+    return document
+
+
+def get_stack_of_document(document_key: str) -> list[NodeItem]:
+    """Return the non-empty generation stack for the key.
+
+    Raises:
+        ValueError: If the stack for the document is empty.
+    """
+    stack = local_stack_cache[document_key]
+    if not stack:
+        raise ValueError(
+            f"Stack size is zero for document with document-key: {document_key}. Abort document generation"
+        )
+    return stack
+
+
+if RAG_ENABLED and OLLAMA_MODEL is not None and EMBEDDING_MODEL is not None:
+    # A large embedding batch collapses the per-chunk round trips of a
+    # freshly parsed document into a handful of batched calls
+    embed_model = HuggingFaceEmbedding(
+        model_name=EMBEDDING_MODEL,
+        embed_batch_size=int(os.getenv("EMBED_BATCH_SIZE", "256")),
+    )
     Settings.embed_model = embed_model
     Settings.llm = Ollama(model=OLLAMA_MODEL, request_timeout=120.0)
-    
-    
+
     node_parser = DoclingNodeParser()
 
     embed_dim = len(embed_model.get_text_embedding("hi"))
 
+    # Index and search configuration for Milvus. The default (FLAT) index is
+    # exact but scales linearly with corpus size; set MILVUS_INDEX_TYPE to
+    # e.g. HNSW or IVF_FLAT for approximate search on larger corpora.
+    milvus_index_config: dict[str, Any] = {}
+    milvus_search_config: dict[str, Any] = {}
+    if os.getenv("MILVUS_INDEX_TYPE"):
+        milvus_index_config = {
+            "index_type": os.environ["MILVUS_INDEX_TYPE"],
+            "metric_type": os.getenv("MILVUS_METRIC_TYPE", "COSINE"),
+            "params": json.loads(os.getenv("MILVUS_INDEX_PARAMS", "{}")),
+        }
+        milvus_search_config = {
+            "params": json.loads(os.getenv("MILVUS_SEARCH_PARAMS", "{}")),
+        }
+
     milvus_vector_store = MilvusVectorStore(
-        uri="./milvus_demo.db", dim=embed_dim, overwrite=True
+        uri="./milvus_demo.db",
+        dim=embed_dim,
+        overwrite=True,
+        index_config=milvus_index_config,
+        search_config=milvus_search_config,
     )
 
     local_index_cache: dict[str, VectorStoreIndex] = {}
-if (
-    OLLAMA_EXTRACTION_MODEL is not None
-):
-    extraction_model = Ollama(model=OLLAMA_EXTRACTION_MODEL, request_timeout=120.0)
\ No newline at end of file
+if EXTRACTION_ENABLED and OLLAMA_EXTRACTION_MODEL is not None:
+    extraction_model = Ollama(model=OLLAMA_EXTRACTION_MODEL, request_timeout=120.0)
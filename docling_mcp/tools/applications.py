@@ -1,22 +1,18 @@
 """This module defines applications."""
 
-import os
-from typing import Any, Optional
+import asyncio
+import itertools
+import time
 
 from docling_core.types.doc.document import DoclingDocument
 
+from docling_mcp.config import EXTRACTION_ENABLED, RAG_ENABLED
 from docling_mcp.logger import setup_logger
 from docling_mcp.shared import local_document_cache, mcp
 
 logger = setup_logger()
 
-if (
-    os.getenv("RAG_ENABLED") == "true"
-    and os.getenv("OLLAMA_MODEL") != ""
-    and os.getenv("EMBEDDING_MODEL") != ""
-):
-    import json
-
+if RAG_ENABLED:
     from llama_index.core import Document, StorageContext, VectorStoreIndex
     from llama_index.core.base.response.schema import (
         RESPONSE_TYPE,
@@ -27,57 +23,83 @@ if (
 
     from docling_mcp.shared import local_index_cache, milvus_vector_store, node_parser
 
+    def _docling_to_llama_document(docling_document: DoclingDocument) -> Document:
+        """Build the llama-index Document for a Docling document in one step.
+
+        The markdown text and the structured metadata are produced together,
+        so future metadata extensions stay in this single place instead of
+        adding further passes over the document tree.
+        """
+        return Document(
+            text=docling_document.export_to_markdown(),
+            metadata={
+                "filename": docling_document.name,
+                "num_pages": len(docling_document.pages),
+                "num_tables": len(docling_document.tables),
+            },
+        )
+
     @mcp.tool()
-    def export_docling_document_to_vector_db(document_key: str) -> str:
-        """Exports a document from the local document cache to a vector database for search capabilities.
+    async def export_docling_documents_to_vector_db(document_keys: list[str]) -> str:
+        """Exports documents from the local document cache to a vector database for search capabilities.
 
-        This tool converts a Docling document that exists in the local cache into markdown format,
-        then loads it into a vector database index. This allows the document to be searched using
-        semantic search techniques.
+        This tool converts Docling documents that exist in the local cache and loads
+        them into a vector database index in a single bulk insert. This allows the
+        documents to be searched using semantic search techniques.
 
         Args:
-            document_key (str): The unique identifier for the document in the local cache.
+            document_keys (list[str]): The unique identifiers for the documents in the local cache.
 
         Returns:
-            str: A confirmation message indicating the document was successfully indexed.
+            str: A confirmation message indicating the documents were successfully indexed.
 
         Raises:
-            ValueError: If the specified document_key does not exist in the local cache.
+            ValueError: If one of the specified document_keys does not exist in the local cache.
 
         Example:
-            export_docling_document_to_vector_db("doc123")
+            export_docling_documents_to_vector_db(["doc123", "doc456"])
         """
-        if document_key not in local_document_cache:
-            doc_keys = ", ".join(local_document_cache.keys())
-            raise ValueError(
-                f"document-key: {document_key} is not found. Existing document-keys are: {doc_keys}"
-            )
-
-        docling_document: DoclingDocument = local_document_cache[document_key]
-        document_dict: dict[str, Any] = docling_document.export_to_dict()
-        document_json: str = json.dumps(document_dict)
+        documents: list[Document] = []
+        for document_key in document_keys:
+            if document_key not in local_document_cache:
+                # Only show a bounded sample of keys; joining the full key
+                # list can produce a pathological message on a large cache
+                doc_keys = ", ".join(itertools.islice(local_document_cache, 10))
+                raise ValueError(
+                    f"document-key: {document_key} is not found. "
+                    f"{len(local_document_cache)} document-keys cached, "
+                    f"first 10: {doc_keys}"
+                )
 
-        document = Document(
-            text=document_json,
-            metadata={"filename": docling_document.name},
-        )
+            docling_document: DoclingDocument = local_document_cache[document_key]
+            documents.append(_docling_to_llama_document(docling_document))
 
-        index = VectorStoreIndex.from_documents(
-            documents=[document],
+        # Chunking and embedding block for a long time; run them in a worker
+        # thread to keep the server's event loop responsive
+        index = await asyncio.to_thread(
+            VectorStoreIndex.from_documents,
+            documents=documents,
             transformations=[node_parser],
             storage_context=StorageContext.from_defaults(
                 vector_store=milvus_vector_store
             ),
         )
 
-        index.insert(document)
+        milvus_vector_store.client.flush(milvus_vector_store.collection_name)
 
         local_index_cache["milvus_index"] = index
 
-        return f"Successful initialisation for document with id {document_key}"
+        return f"Successful initialisation for documents with ids {document_keys}"
+
+    # Responses for recently seen queries, keyed on the normalized query
+    # string. A cache hit skips the query embedding, the ANN search and the
+    # LLM synthesis entirely; entries expire after _SEARCH_CACHE_TTL seconds.
+    _SEARCH_CACHE_TTL: float = 300.0
+    _SEARCH_CACHE_MAX_SIZE: int = 512
+    _search_response_cache: dict[str, tuple[float, str]] = {}
 
     @mcp.tool()
-    def search_documents(query: str) -> str:
+    async def search_documents(query: str) -> str:
         """Searches through previously uploaded and indexed documents using semantic search.
 
         This function retrieves relevant information from documents that have been processed
@@ -94,14 +116,27 @@ if (
         Example:
             search_documents("What are the main findings about climate change?")
         """
+        normalized_query = query.strip().lower()
+
+        cached = _search_response_cache.get(normalized_query)
+        if cached is not None and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL:
+            return cached[1]
+
         index = local_index_cache["milvus_index"]
 
         query_engine = index.as_query_engine()
-        response: RESPONSE_TYPE = query_engine.query(query)
+        response: RESPONSE_TYPE = await asyncio.to_thread(query_engine.query, query)
 
         if isinstance(response, Response):
             if response.response is not None:
-                return response.response
+                answer: str = response.response
+                if len(_search_response_cache) >= _SEARCH_CACHE_MAX_SIZE:
+                    _search_response_cache.pop(next(iter(_search_response_cache)))
+                _search_response_cache[normalized_query] = (
+                    time.monotonic(),
+                    answer,
+                )
+                return answer
             else:
                 raise McpError(
                     ErrorData(
@@ -117,34 +152,49 @@ if (
                 )
             )
 
-if (
-    os.getenv("OLLAMA_EXTRACTION_MODEL") != ""
-):
-    import json
-
-    from mcp.shared.exceptions import McpError
-    from mcp.types import INTERNAL_ERROR, ErrorData
 
+if EXTRACTION_ENABLED:
     from docling_mcp.shared import extraction_model
-    
-    
+
+    # The static part of the extraction prompt; only the schema, text and
+    # optional instructions are formatted in per call
+    _EXTRACTION_PROMPT_PREFIX = (
+        "<|input|>\n"
+        "### Instruction: Extract strings from the text matching the given schema. "
+        "The output must strictly follow the schema and contain only the exact "
+        "strings as they appear in the text—no paraphrasing. If information is "
+        'missing, return "" for empty strings, [] for empty arrays, or [] for an '
+        "empty list of objects. Provide the output as JSON only, with no "
+        "additional comments or explanations.\n"
+    )
+
     @mcp.tool()
-    def kv_extraction(text: str, extraction_schema: str, additional_instructions: Optional[str] = "") -> str:
-        extraction_prompt = f"""
-            <|input|>\n### Instruction: Extract strings from the text matching the given schema. The output must strictly follow the schema and contain only the exact strings as they appear in the text—no paraphrasing. If information is missing, return "" for empty strings, [] for empty arrays, or [] for an empty list of objects. Provide the output as JSON only, with no additional comments or explanations.
-            {additional_instructions}\n
-            ### Schema:\n
-            {extraction_schema}
-            ### Text:\n
-            {text}
-            \n\n<|output|>"
+    async def kv_extraction(
+        text: str,
+        extraction_schema: str,
+        additional_instructions: str | None = "",
+    ) -> str:
+        """Extracts key-value data from the text according to the given schema.
+
+        Args:
+            text (str): The text to extract information from.
+            extraction_schema (str): The JSON schema the extraction must follow.
+            additional_instructions (str, optional): Extra instructions appended
+                to the extraction prompt.
+
+        Returns:
+            str: The raw JSON string emitted by the extraction model.
         """
-        
-        llm_output = extraction_model.complete(extraction_prompt)
-        
-        # cleaned_output = clean_extraction(llm_output)
-        
-        return cleaned_output
-        
-        # cleaning the output
-        # returning the str of an extraction schema 
\ No newline at end of file
+        extraction_prompt = (
+            f"{_EXTRACTION_PROMPT_PREFIX}{additional_instructions}\n\n"
+            f"### Schema:\n{extraction_schema}\n"
+            f"### Text:\n{text}\n\n<|output|>"
+        )
+
+        def _stream_extraction() -> str:
+            # Consume tokens as the model emits them instead of waiting for
+            # the full completion object
+            response_gen = extraction_model.stream_complete(extraction_prompt)
+            return "".join(chunk.delta or "" for chunk in response_gen)
+
+        return await asyncio.to_thread(_stream_extraction)
@@ -1,6 +1,12 @@
 """Tools for converting documents into DoclingDocument objects."""
 
-import gc
+import asyncio
+import binascii
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import Annotated, Any
 
 from mcp.shared.exceptions import McpError
@@ -14,12 +20,13 @@ from docling.datamodel.pipeline_options import (
 from docling.document_converter import DocumentConverter, FormatOption, PdfFormatOption
 from docling_core.types.doc.document import (
     ContentLayer,
+    DoclingDocument,
 )
 from docling_core.types.doc.labels import (
     DocItemLabel,
 )
 
-from docling_mcp.docling_cache import get_cache_key
+from docling_mcp.docling_cache import get_cache_key, save_document_to_cache_dir
 from docling_mcp.logger import setup_logger
 from docling_mcp.shared import local_document_cache, local_stack_cache, mcp
 
@@ -27,10 +34,54 @@ from docling_mcp.shared import local_document_cache, local_stack_cache, mcp
 logger = setup_logger()
 
 
-def cleanup_memory() -> None:
-    """Force garbage collection to free up memory."""
-    logger.info("Performed memory cleanup")
-    gc.collect()
+def _pick_device() -> AcceleratorDevice:
+    """Select the accelerator device for conversion.
+
+    A DOCLING_ACCEL environment variable takes precedence; otherwise pick the
+    best available backend in the order CUDA, MPS, CPU.
+    """
+    env_device = os.getenv("DOCLING_ACCEL")
+    if env_device:
+        try:
+            return AcceleratorDevice(env_device.lower())
+        except ValueError:
+            logger.warning(
+                f"Unknown DOCLING_ACCEL value: {env_device}. Auto-detecting instead."
+            )
+
+    try:
+        import torch
+    except ImportError:
+        return AcceleratorDevice.CPU
+
+    if torch.cuda.is_available():
+        return AcceleratorDevice.CUDA
+    if torch.backends.mps.is_available():
+        return AcceleratorDevice.MPS
+    return AcceleratorDevice.CPU
+
+
+# Detected once at module load; workers re-detect in their own process
+_ACCELERATOR_DEVICE = _pick_device()
+
+# Guards concurrent first calls so two converters are never built in parallel
+_converter_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_converter(device: AcceleratorDevice) -> DocumentConverter:
+    """Build and cache a DocumentConverter for the given accelerator device.
+
+    Constructing a converter loads the pipeline models, which costs seconds;
+    caching one converter per device amortizes that across all conversions.
+    """
+    pipeline_options = PdfPipelineOptions(accelerator_device=device)
+    format_options: dict[InputFormat, FormatOption] = {
+        InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+    }
+
+    logger.info(f"Creating DocumentConverter with format_options: {format_options}")
+    return DocumentConverter(format_options=format_options)
 
 
 @mcp.tool()
@@ -47,7 +98,24 @@ def is_document_in_local_cache(cache_key: str) -> bool:
 
 
 @mcp.tool()
-def convert_pdf_document_into_json_docling_document_from_uri_path(
+def are_documents_in_local_cache(cache_keys: list[str]) -> dict[str, bool]:
+    """Verify for a batch of documents whether they are in the local cache.
+
+    Checking many keys in one call avoids paying the per-call RPC dispatch
+    overhead once per key.
+
+    Args:
+        cache_keys: Document identifiers in the cache.
+
+    Returns:
+        A mapping from each cache key to whether the corresponding document
+        is already converted and in the local cache.
+    """
+    return {cache_key: cache_key in local_document_cache for cache_key in cache_keys}
+
+
+@mcp.tool()
+async def convert_pdf_document_into_json_docling_document_from_uri_path(
     source: str,
 ) -> tuple[bool, str]:
     """Convert a PDF document from a URL or local path and store in local cache.
@@ -68,37 +136,27 @@ def convert_pdf_document_into_json_docling_document_from_uri_path(
         # Remove any quotes from the source string
         source = source.strip("\"'")
 
-        # Log the cleaned source
-        logger.info(f"Processing document from source: {source}")
-
-        # Generate cache key
+        # Check the cache first so the common already-converted case returns
+        # before any logging or converter setup
         cache_key = get_cache_key(source)
 
-        if cache_key in local_document_cache:
-            logger.info(f"{source} has previously been added.")
+        if local_document_cache.get(cache_key) is not None:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"{source} has previously been added.")
             return False, "Document already exists in the system cache."
 
         # Log the start of processing
-        logger.info("Set up pipeline options")
-
-        # Configure pipeline
-        # ocr_options = EasyOcrOptions(lang=ocr_language or ["en"])
-        pipeline_options = PdfPipelineOptions(
-            # do_ocr=False,
-            # ocr_options=ocr_options,
-            accelerator_device=AcceleratorDevice.MPS  # Explicitly set MPS
-        )
-        format_options: dict[InputFormat, FormatOption] = {
-            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-        }
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Processing document from source: {source}")
 
-        # Create converter with MPS acceleration
-        logger.info(f"Creating DocumentConverter with format_options: {format_options}")
-        converter = DocumentConverter(format_options=format_options)
+        # Reuse the shared converter on the detected accelerator device
+        with _converter_lock:
+            converter = _get_converter(_ACCELERATOR_DEVICE)
 
-        # Convert the document
+        # Convert the document in a worker thread so the long-running,
+        # blocking conversion does not stall the server's event loop
         logger.info("Start conversion")
-        result = converter.convert(source)
+        result = await asyncio.to_thread(converter.convert, source)
 
         # Check for errors - handle different API versions
         has_error = False
@@ -129,12 +187,13 @@ def convert_pdf_document_into_json_docling_document_from_uri_path(
 
         local_stack_cache[cache_key] = [item]
 
+        # Spill the document to disk so it survives an LRU eviction (and a
+        # server restart) without having to be converted again
+        save_document_to_cache_dir(cache_key, result.document)
+
         # Log completion
         logger.info(f"Successfully created the Docling document: {source}")
 
-        # Clean up memory
-        cleanup_memory()
-
         return True, cache_key
 
     except Exception as e:
@@ -144,6 +203,93 @@ def convert_pdf_document_into_json_docling_document_from_uri_path(
         ) from e
 
 
+def _convert_pdf_in_worker(source: str) -> tuple[str, str]:
+    """Convert a single PDF document in a worker process.
+
+    Each worker builds its own DocumentConverter (converters are not picklable
+    across processes) and returns the cache key together with the serialized
+    document, which the parent process deserializes into the local cache.
+    """
+    converter = _get_converter(_ACCELERATOR_DEVICE)
+
+    result = converter.convert(source)
+
+    return get_cache_key(source), result.document.model_dump_json()
+
+
+@mcp.tool()
+async def convert_pdfs_batch(sources: list[str]) -> list[tuple[bool, str]]:
+    """Convert multiple PDF documents in parallel and store them in the local cache.
+
+    Docling's conversion pipeline is CPU-heavy, so converting many documents
+    one after another serializes on a single core. This tool fans the
+    conversions out over a process pool sized to the machine's CPU count.
+
+    Args:
+        sources: URLs or local file paths to the documents.
+
+    Returns:
+        One tuple per source, in input order, the first element being a
+        boolean representing success and the second the cache_key (or an
+        error message on failure).
+
+    Usage:
+        convert_pdfs_batch(["https://arxiv.org/pdf/2408.09869", "/path/to/document.pdf"])
+    """
+    sources = [source.strip("\"'") for source in sources]
+
+    results: dict[str, tuple[bool, str]] = {}
+    pending: list[str] = []
+
+    for source in sources:
+        cache_key = get_cache_key(source)
+        if cache_key in local_document_cache:
+            logger.info(f"{source} has previously been added.")
+            results[source] = (False, "Document already exists in the system cache.")
+        else:
+            pending.append(source)
+
+    if pending:
+        max_workers = min(len(pending), os.cpu_count() or 1)
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                source: executor.submit(_convert_pdf_in_worker, source)
+                for source in pending
+            }
+
+            # Await the worker results instead of blocking on them, so the
+            # long-running batch does not stall the server's event loop
+            for source, future in futures.items():
+                try:
+                    cache_key, document_json = await asyncio.wrap_future(future)
+                except Exception as e:
+                    logger.exception(f"Error converting document: {source}")
+                    results[source] = (False, f"Unexpected error: {e!s}")
+                    continue
+
+                document = DoclingDocument.model_validate_json(document_json)
+                local_document_cache[cache_key] = document
+
+                item = document.add_text(
+                    label=DocItemLabel.TEXT,
+                    text=f"source: {source}",
+                    content_layer=ContentLayer.FURNITURE,
+                )
+                local_stack_cache[cache_key] = [item]
+
+                save_document_to_cache_dir(cache_key, document)
+
+                logger.info(f"Successfully created the Docling document: {source}")
+                results[source] = (True, cache_key)
+        finally:
+            # All futures are done by now; a non-waiting shutdown avoids
+            # joining the worker processes on the event loop
+            executor.shutdown(wait=False)
+
+    return [results[source] for source in sources]
+
+
 @mcp.tool()
 def convert_attachments_into_docling_document(
     pdf_payloads: list[Annotated[bytes, {"media_type": "application/octet-stream"}]],
@@ -158,11 +304,15 @@ def convert_attachments_into_docling_document(
     """
     results = []
     for pdf_payload in pdf_payloads:
+        # Wrap the payload in a memoryview so the size and header reads below
+        # (and any future parsing) work zero-copy on the attachment bytes
+        payload_view = memoryview(pdf_payload)
+
         # Example processing - you can replace this with your actual processing logic
-        file_size = len(pdf_payload)
+        file_size = len(payload_view)
 
         # First few bytes as hex for identification
-        header_bytes = pdf_payload[:10].hex()
+        header_bytes = binascii.hexlify(payload_view[:10]).decode()
 
         # You can implement file type detection, parsing, or any other processing here
         # For example, if it's an image, you might use PIL to process it
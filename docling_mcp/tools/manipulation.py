@@ -1,22 +1,226 @@
 """Tools for manipulating Docling documents."""
 
+import copy
+import functools
+import io
+import json
+import re
+import sys
+from collections.abc import Callable
+from typing import Any
+
 from docling_core.types.doc.document import (
     DocItem,
+    DoclingDocument,
     GroupItem,
+    NodeItem,
     RefItem,
     SectionHeaderItem,
     TextItem,
     TitleItem,
 )
+from docling_core.types.doc.labels import (
+    DocItemLabel,
+    GroupLabel,
+)
 
 from docling_mcp.logger import setup_logger
-from docling_mcp.shared import local_document_cache, mcp
-import json
-import re
+from docling_mcp.shared import (
+    MAX_CACHED_DOCUMENTS,
+    get_cached_document,
+    mcp,
+    register_eviction_listener,
+)
+
+try:
+    # Rust-based JSON parsing for the LLM-output hot path; optional, with the
+    # stdlib parser as the fallback (both produce plain dict/list/str trees)
+    import orjson
+
+    _loads: Callable[[str | bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # Create a default project logger
 logger = setup_logger()
 
+# Precomputed indent strings for the document-overview output, so the hot
+# loop indexes a tuple instead of building a new string per item; depths
+# beyond the table fall back to building the string
+_INDENTS = tuple("  " * i for i in range(256))
+_INDENTS_SIZE = len(_INDENTS)
+
+# Lazily built cref -> node indexes, one per document key, so repeated anchor
+# lookups cost a dict probe instead of a pydantic RefItem construction plus a
+# tree walk. Each entry remembers the document object it was built from, so
+# an index never outlives its document (an LRU eviction and reload yields a
+# fresh object under the same key). Structural mutations must still
+# invalidate the document's index, and eviction from the document cache
+# drops the entry (see the listener registration below) so the index never
+# pins an evicted document in memory. The explicit size bound is a backstop
+# mirroring the document cache's own limit.
+_ref_index_cache: dict[str, tuple[DoclingDocument, dict[str, NodeItem]]] = {}
+
+# Compiled once at import; matches a key whose value is an object wrapping a
+# single bare string, the malformation fix_invalid_json repairs
+_INVALID_JSON_RE = re.compile(r'("\w+":)\s*\{\s*"([^"]+)"\s*\}')
+
+# Sentinel distinguishing "entry absent" from any value a lookup could hold
+_MISSING = object()
+
+
+def _get_ref_index(doc: DoclingDocument, document_key: str) -> dict[str, NodeItem]:
+    """Return the cref -> node index for the document, building it on first use.
+
+    The cached index is only reused while it belongs to this exact document
+    object; a different object under the same key triggers a rebuild.
+    """
+    entry = _ref_index_cache.get(document_key)
+    if entry is not None and entry[0] is doc:
+        return entry[1]
+
+    index = {item.get_ref().cref: item for item, _ in doc.iterate_items()}
+    if len(_ref_index_cache) >= MAX_CACHED_DOCUMENTS:
+        # Backstop bound: drop the oldest entry (dicts iterate in insertion
+        # order) so the index cache can never outgrow the document cache
+        _ref_index_cache.pop(next(iter(_ref_index_cache)))
+    _ref_index_cache[document_key] = (doc, index)
+    return index
+
+
+def _invalidate_ref_index(document_key: str) -> None:
+    """Drop the document's anchor index after a structural mutation or eviction."""
+    _ref_index_cache.pop(document_key, None)
+
+
+# Release a document's anchor index when the LRU cache evicts the document;
+# otherwise the index would keep the evicted object alive and silently
+# defeat the document cache's memory bound
+register_eviction_listener(_invalidate_ref_index)
+
+
+def _delete_items_by_cref(
+    doc: DoclingDocument, document_key: str, anchors: frozenset[str]
+) -> list[str]:
+    """Delete every item matching the anchors in a single batched pass.
+
+    Matches are gathered through the per-document index (at most one
+    traversal to build it) and handed to doc.delete_items in one call.
+    Anchors the index does not cover — group and furniture items sit outside
+    its default iteration layers — fall back to a regular RefItem resolve,
+    the same way _resolve_ref covers them for the other manipulation tools.
+
+    Returns:
+        The sorted anchors that could not be resolved; nothing is deleted in
+        that case. An empty list means all items were deleted.
+    """
+    index = _get_ref_index(doc, document_key)
+
+    items: list[NodeItem] = []
+    missing: list[str] = []
+    for anchor in sorted(anchors):
+        item = index.get(anchor)
+        if item is None:
+            try:
+                item = RefItem(cref=anchor).resolve(doc=doc)
+            except (AttributeError, KeyError, IndexError, ValueError):
+                missing.append(anchor)
+                continue
+        items.append(item)
+
+    if missing:
+        return missing
+
+    doc.delete_items(node_items=items)
+
+    # Deleting renumbers the remaining items' references, so the cached
+    # index no longer matches the document
+    _invalidate_ref_index(document_key)
+
+    return []
+
+
+def _resolve_ref(doc: DoclingDocument, document_key: str, cref: str) -> NodeItem:
+    """Resolve an anchor via the per-document index.
+
+    Anchors the index does not cover (items added after the index was built,
+    or anchors outside the default iteration layers) fall back to a regular
+    RefItem resolve, and the result is memoized for the next lookup.
+    """
+    index = _get_ref_index(doc, document_key)
+    item = index.get(cref)
+    if item is None:
+        item = RefItem(cref=cref).resolve(doc=doc)
+        index[cref] = item
+    return item
+
+
+@functools.cache
+def _label_str(label: DocItemLabel | GroupLabel) -> str:
+    """Interned string form of an item label, built once per enum member.
+
+    The labels repeat across thousands of items, so the overview loop reuses
+    one interned string per label instead of re-formatting the enum each time.
+    """
+    return sys.intern(format(label))
+
+
+def _format_title(
+    item: TitleItem, cref: str, level: int, slevel: int
+) -> tuple[str, int]:
+    """Format an overview line for a title item."""
+    return f"[anchor:{cref}] {_label_str(item.label)}: {item.text}\n", slevel
+
+
+def _format_section_header(
+    item: SectionHeaderItem, cref: str, level: int, slevel: int
+) -> tuple[str, int]:
+    """Format an overview line for a section header, updating the section level."""
+    slevel = item.level
+    n = level + slevel
+    indent = _INDENTS[n] if n < _INDENTS_SIZE else "  " * n
+    return (
+        f"{indent}[anchor:{cref}] {_label_str(item.label)}-{level}: {item.text}\n",
+        slevel,
+    )
+
+
+def _format_default(
+    item: DocItem | GroupItem, cref: str, level: int, slevel: int
+) -> tuple[str, int]:
+    """Format an overview line for any other document or group item."""
+    n = level + slevel + 1
+    indent = _INDENTS[n] if n < _INDENTS_SIZE else "  " * n
+    return f"{indent}[anchor:{cref}] {_label_str(item.label)}\n", slevel
+
+
+def _format_skip(item: NodeItem, cref: str, level: int, slevel: int) -> tuple[str, int]:
+    """No-op formatter for item types the overview omits."""
+    return "", slevel
+
+
+_Formatter = Callable[[Any, str, int, int], "tuple[str, int]"]
+
+# Exact-type dispatch for the overview loop: one dict lookup replaces the
+# isinstance chain for the common item types. Types not seeded here are
+# classified once via the isinstance chain and memoized (_format_skip marks
+# types the overview omits), so the ladder runs once per type, not per item
+_OVERVIEW_FORMATTERS: dict[type[NodeItem], _Formatter] = {
+    TitleItem: _format_title,
+    SectionHeaderItem: _format_section_header,
+}
+
+
+def _classify_formatter(item: NodeItem) -> _Formatter:
+    """Pick the overview formatter for an item type seen for the first time."""
+    if isinstance(item, TitleItem):
+        return _format_title
+    if isinstance(item, SectionHeaderItem):
+        return _format_section_header
+    if isinstance(item, DocItem | GroupItem):
+        return _format_default
+    return _format_skip
+
 
 @mcp.tool()
 def get_overview_of_document_anchors(document_key: str) -> str:
@@ -39,39 +243,25 @@ def get_overview_of_document_anchors(document_key: str) -> str:
     Example:
         get_overview_of_document_anchors(document_key="doc123")
     """
-    if document_key not in local_document_cache:
-        doc_keys = ", ".join(local_document_cache.keys())
-        raise ValueError(
-            f"document-key: {document_key} is not found. Existing document-keys are: {doc_keys}"
-        )
+    doc = get_cached_document(document_key)
 
-    doc = local_document_cache[document_key]
-
-    lines = []
+    # A single StringIO buffer avoids one transient str object per line plus
+    # the final join copy that a list of lines would cost
+    buffer = io.StringIO()
     slevel = 0
     for item, level in doc.iterate_items():
-        ref = item.get_ref()
-
-        if isinstance(item, DocItem):
-            if isinstance(item, TitleItem):
-                lines.append(f"[anchor:{ref.cref}] {item.label}: {item.text}")
-
-            elif isinstance(item, SectionHeaderItem):
-                slevel = item.level
-                indent = "  " * (level + slevel)
-                lines.append(
-                    f"{indent}[anchor:{ref.cref}] {item.label}-{level}: {item.text}"
-                )
-
-            else:
-                indent = "  " * (level + slevel + 1)
-                lines.append(f"{indent}[anchor:{ref.cref}] {item.label}")
+        item_type = type(item)
+        formatter = _OVERVIEW_FORMATTERS.get(item_type)
+        if formatter is None:
+            formatter = _classify_formatter(item)
+            _OVERVIEW_FORMATTERS[item_type] = formatter
 
-        elif isinstance(item, GroupItem):
-            indent = "  " * (level + slevel + 1)
-            lines.append(f"{indent}[anchor:{ref.cref}] {item.label}")
+        # Items carry their reference string directly; self_ref skips the
+        # RefItem allocation get_ref() performs per call
+        line, slevel = formatter(item, item.self_ref, level, slevel)
+        buffer.write(line)
 
-    return "\n".join(lines)
+    return buffer.getvalue()[:-1]
 
 
 @mcp.tool()
@@ -97,16 +287,9 @@ def get_text_of_document_item_at_anchor(document_key: str, document_anchor: str)
     Example:
         get_text_of_document_item_at_anchor(document_key="doc123", document_anchor="#/texts/2")
     """
-    if document_key not in local_document_cache:
-        doc_keys = ", ".join(local_document_cache.keys())
-        raise ValueError(
-            f"document-key: {document_key} is not found. Existing document-keys are: {doc_keys}"
-        )
-
-    doc = local_document_cache[document_key]
+    doc = get_cached_document(document_key)
 
-    ref = RefItem(cref=document_anchor)
-    item = ref.resolve(doc=doc)
+    item = _resolve_ref(doc, document_key, document_anchor)
 
     if isinstance(item, TextItem):
         text = item.text
@@ -143,19 +326,15 @@ def update_text_of_document_item_at_anchor(
     Example:
         update_text_of_document_item_at_anchor(document_key="doc123", document_anchor="#/texts/2", updated_text="This is the new content.")
     """
-    if document_key not in local_document_cache:
-        doc_keys = ", ".join(local_document_cache.keys())
-        raise ValueError(
-            f"document-key: {document_key} is not found. Existing document-keys are: {doc_keys}"
-        )
-
-    doc = local_document_cache[document_key]
+    doc = get_cached_document(document_key)
 
-    ref = RefItem(cref=document_anchor)
-    item = ref.resolve(doc=doc)
+    item = _resolve_ref(doc, document_key, document_anchor)
 
     if isinstance(item, TextItem):
-        item.text = updated_text
+        # LLM tool loops often rewrite an item with identical content; the
+        # equality check skips pydantic's assignment validation in that case
+        if item.text != updated_text:
+            item.text = updated_text
     else:
         raise ValueError(
             f"Item at {document_anchor} for document-key: {document_key} is not a textual item."
@@ -187,49 +366,145 @@ def delete_document_items_at_anchors(
     Example:
         delete_document_items_at_anchors(document_key="doc123", document_anchors=["#/texts/2", "#/tables/1"])
     """
-    if document_key not in local_document_cache:
-        doc_keys = ", ".join(local_document_cache.keys())
+    doc = get_cached_document(document_key)
+
+    missing = _delete_items_by_cref(doc, document_key, frozenset(document_anchors))
+    if missing:
         raise ValueError(
-            f"document-key: {document_key} is not found. Existing document-keys are: {doc_keys}"
+            f"Anchors not found in document with key {document_key}: {missing}. No items were deleted."
         )
 
-    doc = local_document_cache[document_key]
+    return f"Deleted the {document_anchors} for document with key {document_key}"
 
-    items = []
-    for _ in document_anchors:
-        ref = RefItem(cref=_)
-        items.append(ref.resolve(doc=doc))
 
-    doc.delete_items(node_items=items)
+class _SchemaValidator:
+    """A schema compiled into a flat field table.
 
-    return f"Deleted the {document_anchors} for document with key {document_key}"
+    Each field is a (key, sub-validator, default) triple, so validating a
+    payload is one tight loop over a tuple with no isinstance dispatch on the
+    schema side — that work happened once at compile time. The empty payload
+    for the level is likewise built once, at compile time, as a template.
+    """
+
+    __slots__ = ("empty_template", "fields")
+
+    def __init__(
+        self, fields: tuple[tuple[str, "_SchemaValidator | None", Any], ...]
+    ) -> None:
+        self.fields = fields
+        self.empty_template: dict[str, Any] = {
+            key: sub.empty_template if sub is not None else default
+            for key, sub, default in fields
+        }
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return data sanitized to the compiled schema."""
+        validated: dict[str, Any] = {}
+        for key, sub, default in self.fields:
+            candidate = data.get(key, _MISSING)
+            if sub is not None:
+                if isinstance(candidate, dict):
+                    validated[key] = sub.validate(candidate)
+                else:
+                    validated[key] = sub.empty()
+            elif candidate is _MISSING or not _is_valid_value_type(candidate):
+                validated[key] = default
+            else:
+                validated[key] = candidate
+        return validated
+
+    def empty(self) -> dict[str, Any]:
+        """Return the empty payload for this schema level.
+
+        Deep-copied from the precomputed template so callers may mutate the
+        result; the recursive schema walk itself is never repeated.
+        """
+        return copy.deepcopy(self.empty_template)
+
+
+def _compile_fields(schema: dict[str, Any]) -> _SchemaValidator:
+    """Compile one schema level (and its subtrees) into a field table."""
+    return _SchemaValidator(
+        tuple(
+            (
+                key,
+                _compile_fields(expected) if isinstance(expected, dict) else None,
+                None if isinstance(expected, dict) else expected,
+            )
+            for key, expected in schema.items()
+        )
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_schema(schema_json: str) -> _SchemaValidator:
+    """Parse and compile a JSON schema string, memoized on the raw text.
+
+    The schema is fixed across many LLM outputs, so repeated calls with the
+    same schema reuse the compiled validator without re-parsing.
+    """
+    return _compile_fields(json.loads(schema_json))
+
+
+@mcp.tool()
+def output_optimization(llm_output: str, schema: str) -> dict[str, Any]:
+    """Repair an LLM's JSON output and sanitize it against the given schema."""
+    # Each rewrite pass copies the whole string, so run one only when its
+    # target can actually occur: the escape fix needs a literal \_ and the
+    # brace fix needs a nested "{" (the malformation can never start at the
+    # first character). Well-formed output skips both copies.
+    prediction = llm_output
+    if "\\_" in prediction:
+        prediction = prediction.replace("\\_", "_")
+
+    if prediction.find("{", 1) != -1:
+        prediction = _INVALID_JSON_RE.sub(r'\1 "\2"', prediction)
+
+    prediction_dict = _loads(prediction)
+
+    return _compile_schema(schema).validate(prediction_dict)
 
 
-@mcp.tool
-def output_optimization(llm_output: str, schema: str) -> dict:
-    prediction = llm_output.replace(r"\_", "_")  
-    
-    prediction = fix_invalid_json(prediction)
-    
-    prediction_dict = json.loads(prediction)
-    
-    prediction_dict = validate_data_against_schema(prediction_dict, schema)
-    
-    return prediction_dict
-
-@mcp.tool    
-def fix_invalid_json(json_text):
-    # Regex pattern to find cases where a key is followed by an object containing only a string
-    pattern = r'("\w+":)\s*\{\s*"([^"]+)"\s*\}'
-
-    # Replace the invalid JSON structure with a proper key-value pair
-    fixed_json_text = re.sub(pattern, r'\1 "\2"', json_text)
-    return fixed_json_text
-
-@mcp.tool
-def validate_data_against_schema(data: dict, schema: dict) -> dict:
+@mcp.tool()
+def fix_invalid_json(json_text: str) -> str:
+    """Repair keys whose value is an object wrapping a single bare string."""
+    # The malformation needs a "{" beyond the string's first character (it
+    # is always preceded by a key); a single C-level scan rules that out far
+    # cheaper than the regex walk, and most LLM output is valid JSON
+    if json_text.find("{", 1) == -1:
+        return json_text
+
+    # Replace the invalid JSON structure (a key followed by an object
+    # containing only a string) with a proper key-value pair
+    return _INVALID_JSON_RE.sub(r'\1 "\2"', json_text)
+
+
+def _conforms_to_schema(data: dict[str, Any], schema: dict[str, Any]) -> bool:
+    """Check whether data already fits the schema, without allocating.
+
+    A True result lets validate_data_against_schema return the parsed dict
+    as-is instead of rebuilding a sanitized copy — one tree walk instead of
+    a walk plus a full re-allocation for the common well-formed output.
     """
-    Recursively validates and sanitizes data from an LLM so that it fits the specified schema.
+    if data.keys() != schema.keys():
+        return False
+    for key, expected in schema.items():
+        candidate = data[key]
+        if isinstance(expected, dict):
+            if not isinstance(candidate, dict) or not _conforms_to_schema(
+                candidate, expected
+            ):
+                return False
+        elif not _is_valid_value_type(candidate):
+            return False
+    return True
+
+
+@mcp.tool()
+def validate_data_against_schema(
+    data: dict[str, Any], schema: dict[str, Any]
+) -> dict[str, Any]:
+    """Recursively validates and sanitizes data from an LLM so that it fits the specified schema.
 
     For each key in the schema:
       - If the key is missing in data, it is added with an empty version built from the schema.
@@ -240,7 +515,10 @@ def validate_data_against_schema(data: dict, schema: dict) -> dict:
 
     Extra keys in data that are not in the schema are removed.
     """
-    validated = {}
+    if _conforms_to_schema(data, schema):
+        return data
+
+    validated: dict[str, Any] = {}
     for key, expected in schema.items():
         if key not in data:
             # Key is missing; create an empty version based on the expected schema
@@ -261,10 +539,11 @@ def validate_data_against_schema(data: dict, schema: dict) -> dict:
                     validated[key] = expected
     return validated
 
-@mcp.tool
-def _make_empty_value(default):
-    """
-    Creates an "empty" version of the default value from the schema.
+
+@mcp.tool()
+def _make_empty_value(default: Any) -> Any:
+    """Creates an "empty" version of the default value from the schema.
+
     If the default is a dict, it recursively builds an empty dict with the same structure.
     Otherwise, it returns the default (which can be an empty string or list, etc.).
     """
@@ -272,13 +551,14 @@ def _make_empty_value(default):
         return {k: _make_empty_value(v) for k, v in default.items()}
     return default
 
-@mcp.tool
-def _is_valid_value_type(value):
-    """
-    Checks whether the value is either a string or a list of strings.
-    """
+
+@mcp.tool()
+def _is_valid_value_type(value: Any) -> bool:
+    """Checks whether the value is either a string or a list of strings."""
     if isinstance(value, str):
         return True
-    if isinstance(value, list) and all(isinstance(item, str) for item in value):
-        return True
-    return False
\ No newline at end of file
+    if isinstance(value, list):
+        # map dispatches the per-element check in C instead of through a
+        # Python generator frame; empty lists bail out immediately
+        return not value or all(map(str.__instancecheck__, value))
+    return False
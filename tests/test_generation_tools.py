@@ -17,6 +17,8 @@ from docling_mcp.tools.generation import (  # noqa: F401
 
 logger = setup_logger()
 
+_KEY_RE = re.compile(r"document-key:\s*([a-fA-F0-9]{16,64})")
+
 
 def test_create_docling_document() -> None:
     reply = create_new_docling_document(prompt="test-document")
@@ -26,7 +28,7 @@ def test_create_docling_document() -> None:
 
 
 def extract_key_from_reply(reply: str) -> str:
-    match = re.search(r"document-key:\s*([a-fA-F0-9]{32})", reply)
+    match = _KEY_RE.search(reply)
     if match:
         return match.group(1)
 
@@ -0,0 +1,123 @@
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from docling_mcp.logger import setup_logger
+from docling_mcp.shared import local_document_cache
+from docling_mcp.tools.generation import (
+    add_paragraph_to_docling_document,
+    close_list_in_docling_document,
+    create_new_docling_document,
+    open_list_in_docling_document,
+)
+from docling_mcp.tools.manipulation import (
+    _ref_index_cache,
+    delete_document_items_at_anchors,
+    fix_invalid_json,
+    get_overview_of_document_anchors,
+    get_text_of_document_item_at_anchor,
+    output_optimization,
+)
+
+logger = setup_logger()
+
+_KEY_RE = re.compile(r"document-key:\s*([a-fA-F0-9]{16,64})")
+
+
+def extract_key_from_reply(reply: str) -> str:
+    match = _KEY_RE.search(reply)
+    if match:
+        return match.group(1)
+
+    return "<key-not-found>"
+
+
+def test_delete_group_and_furniture_anchors() -> None:
+    reply = create_new_docling_document(prompt="test-delete-group-and-furniture")
+    key = extract_key_from_reply(reply=reply)
+
+    # A group anchor plus the furniture item the document was created with;
+    # neither is covered by the default anchor index layers
+    open_list_in_docling_document(document_key=key)
+    close_list_in_docling_document(document_key=key)
+
+    doc = local_document_cache[key]
+    assert len(doc.groups) == 1
+    assert len(doc.texts) == 1
+
+    reply = delete_document_items_at_anchors(
+        document_key=key, document_anchors=["#/groups/0", "#/texts/0"]
+    )
+
+    assert reply.startswith("Deleted the ")
+    assert len(doc.groups) == 0
+    assert len(doc.texts) == 0
+
+
+def test_delete_unknown_anchor_deletes_nothing() -> None:
+    reply = create_new_docling_document(prompt="test-delete-unknown-anchor")
+    key = extract_key_from_reply(reply=reply)
+
+    add_paragraph_to_docling_document(document_key=key, paragraph="A paragraph.")
+
+    doc = local_document_cache[key]
+    num_texts = len(doc.texts)
+
+    try:
+        delete_document_items_at_anchors(
+            document_key=key, document_anchors=["#/texts/1", "#/texts/99"]
+        )
+    except ValueError as error:
+        assert "#/texts/99" in str(error)
+    else:
+        raise AssertionError("expected a ValueError for the unknown anchor")
+
+    assert len(doc.texts) == num_texts
+
+
+def test_overview_lists_anchors() -> None:
+    reply = create_new_docling_document(prompt="test-overview-anchors")
+    key = extract_key_from_reply(reply=reply)
+
+    add_paragraph_to_docling_document(document_key=key, paragraph="A paragraph.")
+
+    overview = get_overview_of_document_anchors(document_key=key)
+    assert "[anchor:#/texts/1]" in overview
+
+
+def test_eviction_releases_anchor_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path))
+
+    reply = create_new_docling_document(prompt="test-eviction-releases-index")
+    key = extract_key_from_reply(reply=reply)
+    add_paragraph_to_docling_document(document_key=key, paragraph="Indexed.")
+
+    # Resolving an anchor builds the per-document index
+    get_text_of_document_item_at_anchor(document_key=key, document_anchor="#/texts/1")
+    assert key in _ref_index_cache
+
+    # Evicting the document must release its index entry too, or the index
+    # would keep the evicted object pinned in memory
+    monkeypatch.setattr(local_document_cache, "maxsize", 1)
+    create_new_docling_document(prompt="test-eviction-releases-index-filler")
+
+    assert key not in _ref_index_cache
+
+
+def test_fix_invalid_json() -> None:
+    assert fix_invalid_json('{"a": "b"}') == '{"a": "b"}'
+    assert fix_invalid_json('{"a": {"b"}}') == '{"a": "b"}'
+
+
+def test_output_optimization_repairs_and_validates() -> None:
+    schema = json.dumps({"name": "", "tags": []})
+
+    result = output_optimization(
+        llm_output=r'{"name": {"John"}, "extra\_key": "dropped"}', schema=schema
+    )
+
+    assert result == {"name": "John", "tags": []}
@@ -0,0 +1,95 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from docling_mcp.logger import setup_logger
+from docling_mcp.shared import LRUCache, local_document_cache
+from docling_mcp.tools.generation import (
+    add_paragraph_to_docling_document,
+    create_new_docling_document,
+)
+
+logger = setup_logger()
+
+_KEY_RE = re.compile(r"document-key:\s*([a-fA-F0-9]{16,64})")
+
+
+def extract_key_from_reply(reply: str) -> str:
+    match = _KEY_RE.search(reply)
+    if match:
+        return match.group(1)
+
+    return "<key-not-found>"
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    evicted: list[tuple[str, int]] = []
+    cache: LRUCache = LRUCache(
+        maxsize=2, on_evict=lambda key, value: evicted.append((key, value))
+    )
+
+    cache["a"] = 1
+    cache["b"] = 2
+
+    # Touching "a" refreshes its recency, so "b" is the eviction victim
+    assert cache["a"] == 1
+    cache["c"] = 3
+
+    assert evicted == [("b", 2)]
+    assert list(cache.keys()) == ["a", "c"]
+    assert "b" not in cache
+
+
+def test_lru_cache_loader_restores_missing_entries() -> None:
+    spilled = {"x": 41}
+    cache: LRUCache = LRUCache(maxsize=2, loader=spilled.get)
+
+    assert cache["x"] == 41
+    assert "x" in cache.keys()
+
+    with pytest.raises(KeyError):
+        cache["unknown"]
+
+
+def test_lru_cache_membership_probe_does_not_load_or_insert() -> None:
+    loaded: list[str] = []
+
+    def loader(key: str) -> int:
+        loaded.append(key)
+        return 41
+
+    cache: LRUCache = LRUCache(
+        maxsize=1, loader=loader, probe=lambda key: key == "spilled"
+    )
+    cache["resident"] = 1
+
+    # Membership must answer from the probe alone: no load, no insertion,
+    # and the resident entry stays in place
+    assert "spilled" in cache
+    assert "unknown" not in cache
+    assert loaded == []
+    assert list(cache.keys()) == ["resident"]
+
+
+def test_evicted_generated_document_is_spilled_and_reloaded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path))
+
+    reply = create_new_docling_document(prompt="test-spill-on-eviction")
+    key = extract_key_from_reply(reply=reply)
+    add_paragraph_to_docling_document(
+        document_key=key, paragraph="Generated before eviction."
+    )
+
+    # Shrink the cache so the next insert evicts the generated document
+    monkeypatch.setattr(local_document_cache, "maxsize", 1)
+    create_new_docling_document(prompt="test-spill-on-eviction-filler")
+
+    assert key not in list(local_document_cache.keys())
+    assert (tmp_path / f"{key}.json").exists()
+
+    # The miss loader brings the spilled document back transparently
+    reloaded = local_document_cache[key]
+    assert any("Generated before eviction." in item.text for item in reloaded.texts)